@@ -6,6 +6,7 @@ platforms (Cisco and non-Cisco).
 
 Also defines methods that should generally be supported by child classes
 """
+
 from typing import (
     Optional,
     Callable,
@@ -20,11 +21,13 @@ from typing import (
     Union,
     Tuple,
     Deque,
+    Pattern,
 )
 from typing import TYPE_CHECKING
 from types import TracebackType
 import io
 import re
+import select
 import socket
 import telnetlib
 import time
@@ -44,7 +47,6 @@ from netmiko.exceptions import (
     NetmikoTimeoutException,
     NetmikoAuthenticationException,
     ConfigInvalidException,
-    ReadException,
     ReadTimeout,
 )
 from netmiko.channel import Channel, SSHChannel, TelnetChannel, SerialChannel
@@ -66,6 +68,37 @@ if TYPE_CHECKING:
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+# ANSI escape codes removed by strip_ansi_escape_codes() (see its docstring)
+ANSI_ESCAPE_CODES = [
+    r"\x1b\[\d+;\d+H",  # code_position_cursor
+    r"\x1b\[\?25h",  # code_show_cursor
+    r"\x1b\[2K",  # code_erase_line
+    r"\x1b\[\d+;\d+r",  # code_enable_scroll
+    r"\x1b\[K",  # code_erase_line_end / code_erase_start_line
+    r"\x1b\[1M",  # code_carriage_return
+    r"\x1b\[\?7l",  # code_disable_line_wrapping
+    r"\x1b\[\?\d+l",  # code_reset_mode_screen_options
+    r"\x1b\[00m",  # code_reset_graphics_mode
+    r"\x1b\[2J",  # code_erase_display
+    r"\x1b\[\dm",  # code_graphics_mode
+    r"\x1b\[\d\d;\d\dm",  # code_graphics_mode1
+    r"\x1b\[\d\d;\d\d;\d\dm",  # code_graphics_mode2
+    r"\x1b\[(3|4)\dm",  # code_graphics_mode3
+    r"\x1b\[(9|10)[0-7]m",  # code_graphics_mode4
+    r"\x1b\[6n",  # code_get_cursor_position
+    r"\x1b\[m",  # code_cursor_position
+    r"\x1b\[J",  # code_erase_display_0
+    r"\x1b\[0m",  # code_attrs_off
+    r"\x1b\[7m",  # code_reverse
+    r"\x1b\[\d+D",  # code_cursor_left
+    r"\x1b\[\d*A",  # code_cursor_up
+    r"\x1b\[\d*B",  # code_cursor_down
+    r"\x1b\[\d*C",  # code_cursor_forward
+    r"\x1b\[\?7h",  # code_wrap_around
+    r"\x1b\[\?2004h",  # code_bracketed_paste_mode
+]
+ANSI_ESCAPE_RE = re.compile("|".join(ANSI_ESCAPE_CODES))
+
 DELAY_FACTOR_DEPR_SIMPLE_MSG = """\n
 Netmiko 4.x and later has deprecated the use of delay_factor and/or max_loops in
 this context. You should remove any use of delay_factor=x from this method call.\n"""
@@ -115,6 +148,9 @@ class BaseConnection:
     Otherwise method left as a stub method.
     """
 
+    # Single pass regex used by strip_ansi_escape_codes(); drivers can extend it
+    ansi_escape_re: Pattern[str] = ANSI_ESCAPE_RE
+
     def __init__(
         self,
         ip: str = "",
@@ -270,6 +306,9 @@ class BaseConnection:
         # Does the platform support a configuration mode
         self._config_mode = True
         self._read_buffer = ""
+        # Incremented on every write; invalidates cached privilege/config mode checks
+        self._write_counter = 0
+        self._priv_mode_cache: Dict[Tuple[str, str], Tuple[int, bool]] = {}
         self.delay_factor_compat = delay_factor_compat
 
         self.TELNET_RETURN = "\r\n"
@@ -493,6 +532,7 @@ class BaseConnection:
         :type out_data: str
         """
         self.channel.write_channel(out_data)
+        self._write_counter += 1
 
     def is_alive(self) -> bool:
         """Returns a boolean flag with the state of the connection."""
@@ -551,12 +591,41 @@ class BaseConnection:
             output = new_data
         return output
 
+    def _wait_readable(self, timeout: float) -> bool:
+        """Block until the channel has data to read or timeout (in seconds) expires.
+
+        Waits in poll()/select() on the SSH channel instead of sleep/read cycles.
+        Returns False if no data arrived; non-SSH connections always return True.
+        """
+        if self._read_buffer or not isinstance(self.remote_conn, paramiko.Channel):
+            return True
+        if self.remote_conn.recv_ready():
+            return True
+        fileno = self.remote_conn.fileno()
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(fileno, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        # Platforms without poll() (Windows)
+        readable, _, _ = select.select([fileno], [], [], timeout)
+        return bool(readable)
+
+    def _drain_channel(self) -> str:
+        """Keep reading the channel until a read returns no new data."""
+        output = ""
+        while True:
+            new_data = self.read_channel()
+            if not new_data:
+                return output
+            output += new_data
+
     def read_until_pattern(
         self,
         pattern: str = "",
         read_timeout: float = 10.0,
         re_flags: int = 0,
         max_loops: Optional[int] = None,
+        tail_len: int = 0,
     ) -> str:
         """Read channel until pattern is detected.
 
@@ -573,6 +642,11 @@ class BaseConnection:
         :param re_flags: regex flags used in conjunction with pattern (defaults to no flags).
 
         :param max_loops: Deprecated in Netmiko 4.x. Will be eliminated in Netmiko 5.
+
+        :param tail_len: Only re-search the last tail_len characters of previously read
+            output (plus any new data) on each loop. Must be at least as long as the
+            longest possible match (for example a device prompt). A value of 0 searches
+            the entire output on every loop.
         """
         if max_loops is not None:
             msg = """\n
@@ -581,42 +655,56 @@ You should convert all uses of max_loops over to read_timeout=x
 where x is the total number of seconds to wait before timing out.\n"""
             warnings.warn(msg, DeprecationWarning)
 
+        output, _ = self._read_until_match(
+            pattern=pattern,
+            read_timeout=read_timeout,
+            re_flags=re_flags,
+            tail_len=tail_len,
+        )
+        return output
+
+    def _read_until_match(
+        self,
+        pattern: str,
+        read_timeout: float = 10.0,
+        re_flags: int = 0,
+        tail_len: int = 0,
+        keep_on_timeout: bool = False,
+    ) -> Tuple[str, Any]:
+        """Read channel until pattern is detected; return (output, match).
+
+        Same semantics as read_until_pattern, but the match object is also returned so
+        callers can dispatch on named groups (match.lastgroup) without a second search.
+
+        :param keep_on_timeout: On ReadTimeout, put the output read so far back into
+            _read_buffer (so a following read_channel() still returns it).
+        """
         if self.read_timeout_override:
             read_timeout = self.read_timeout_override
 
         output = ""
         loop_delay = 0.01
         start_time = time.time()
+        # Always the re module: patterns here are often user supplied (expect_string)
+        pattern_re = re.compile(pattern, flags=re_flags)
+        search_start = 0
         # if read_timeout == 0 or 0.0 keep reading indefinitely
         while (time.time() - start_time < read_timeout) or (not read_timeout):
+            if tail_len:
+                # Earlier output was already searched; only a match ending in new data
+                # (and starting no more than tail_len before it) is still possible.
+                search_start = max(0, len(output) - tail_len)
             output += self.read_channel()
-            if re.search(pattern, output, flags=re_flags):
-                results = re.split(pattern, output, maxsplit=1, flags=re_flags)
-
-                # The string matched by pattern must be retained in the output string.
-                # re.split will do this if capturing parentesis are used.
-                if len(results) == 2:
-                    # no capturing parenthesis, convert and try again.
-                    pattern = f"({pattern})"
-                    results = re.split(pattern, output, maxsplit=1, flags=re_flags)
-
-                if len(results) != 3:
-                    # well, we tried
-                    msg = f"""Unable to successfully split output based on pattern:
-pattern={pattern}
-output={repr(output)}
-results={results}
-"""
-                    raise ReadException(msg)
-
-                # Process such that everything before and including pattern is return.
+            match = pattern_re.search(output, search_start)
+            if match:
+                # Everything before and including pattern is returned.
                 # Everything else is retained in the _read_buffer
-                output, match_str, buffer = results
-                output = output + match_str
+                buffer = output[match.end() :]
+                output = output[: match.end()]
                 if buffer:
                     self._read_buffer += buffer
                 log.debug(f"Pattern found: {pattern} {output}")
-                return output
+                return output, match
             time.sleep(loop_delay)
 
         msg = f"""\n\nPattern not detected: {repr(pattern)} in output.
@@ -627,6 +715,8 @@ many situations the pattern is automatically based on the network device's promp
 2. Increase the read_timeout to a larger value.
 
 You can also look at the Netmiko session_log or debug log for more information.\n\n"""
+        if keep_on_timeout:
+            self._read_buffer = output + self._read_buffer
         raise ReadTimeout(msg)
 
     def read_channel_timing(
@@ -1058,12 +1148,12 @@ Device settings: {self.device_type} {self.host}:{self.port}
             if self.keepalive:
                 assert isinstance(self.remote_conn.transport, paramiko.Transport)
                 self.remote_conn.transport.set_keepalive(self.keepalive)
+            # Migrating communication to channel class
+            self.channel = SSHChannel(conn=self.remote_conn, encoding=self.encoding)
+
             self.special_login_handler()
             if self.verbose:
                 print("Interactive SSH session established")
-
-            # Migrating communication to channel class
-            self.channel = SSHChannel(conn=self.remote_conn, encoding=self.encoding)
         return None
 
     def _test_channel_read(self, count: int = 40, pattern: str = "") -> str:
@@ -1794,15 +1884,38 @@ You can also look at the Netmiko session_log or debug log for more information.
         command += self.RETURN
         return command
 
+    def _cached_mode_check(
+        self, cache_key: Tuple[str, str], mode_check: Callable[[], bool]
+    ) -> bool:
+        """Reuse a prior mode check result if nothing was written to the channel since.
+
+        :param cache_key: Identifies the check (kind of check and its check_string)
+
+        :param mode_check: Callable that performs the actual check against the device
+        """
+        cached = self._priv_mode_cache.get(cache_key)
+        if cached is not None and cached[0] == self._write_counter:
+            return cached[1]
+        result = mode_check()
+        # mode_check itself writes to the channel so record the counter afterwards
+        self._priv_mode_cache[cache_key] = (self._write_counter, result)
+        return result
+
     def check_enable_mode(self, check_string: str = "") -> bool:
         """Check if in enable mode. Return boolean.
 
+        The result is reused until something else is written to the channel.
+
         :param check_string: Identification of privilege mode from device
         :type check_string: str
         """
-        self.write_channel(self.RETURN)
-        output = self.read_until_prompt(read_entire_line=True)
-        return check_string in output
+
+        def mode_check() -> bool:
+            self.write_channel(self.RETURN)
+            output = self.read_until_prompt(read_entire_line=True)
+            return check_string in output
+
+        return self._cached_mode_check(("enable", check_string), mode_check)
 
     def enable(
         self,
@@ -1875,19 +1988,26 @@ You can also look at the Netmiko session_log or debug log for more information.
     def check_config_mode(self, check_string: str = "", pattern: str = "") -> bool:
         """Checks if the device is in configuration mode or not.
 
+        The result is reused until something else is written to the channel.
+
         :param check_string: Identification of configuration mode from the device
         :type check_string: str
 
         :param pattern: Pattern to terminate reading of channel
         :type pattern: str
         """
-        self.write_channel(self.RETURN)
-        # You can encounter an issue here (on router name changes) prefer delay-based solution
-        if not pattern:
-            output = self.read_channel_timing()
-        else:
-            output = self.read_until_pattern(pattern=pattern)
-        return check_string in output
+
+        def mode_check() -> bool:
+            self.write_channel(self.RETURN)
+            # You can encounter an issue here (on router name changes) prefer
+            # delay-based solution
+            if not pattern:
+                output = self.read_channel_timing()
+            else:
+                output = self.read_until_pattern(pattern=pattern)
+            return check_string in output
+
+        return self._cached_mode_check(("config", check_string), mode_check)
 
     def config_mode(
         self, config_command: str = "", pattern: str = "", re_flags: int = 0
@@ -2135,70 +2255,14 @@ You can also look at the Netmiko session_log or debug log for more information.
         :type string_buffer: str
         """  # noqa
 
-        code_position_cursor = chr(27) + r"\[\d+;\d+H"
-        code_show_cursor = chr(27) + r"\[\?25h"
+        # Every code handled here starts with ESC; skip the regex work if there is none
+        if chr(27) not in string_buffer:
+            return string_buffer
+
         code_next_line = chr(27) + r"E"
-        code_erase_line_end = chr(27) + r"\[K"
-        code_erase_line = chr(27) + r"\[2K"
-        code_erase_start_line = chr(27) + r"\[K"
-        code_enable_scroll = chr(27) + r"\[\d+;\d+r"
         code_insert_line = chr(27) + r"\[(\d+)L"
-        code_carriage_return = chr(27) + r"\[1M"
-        code_disable_line_wrapping = chr(27) + r"\[\?7l"
-        code_reset_mode_screen_options = chr(27) + r"\[\?\d+l"
-        code_reset_graphics_mode = chr(27) + r"\[00m"
-        code_erase_display = chr(27) + r"\[2J"
-        code_erase_display_0 = chr(27) + r"\[J"
-        code_graphics_mode = chr(27) + r"\[\dm"
-        code_graphics_mode1 = chr(27) + r"\[\d\d;\d\dm"
-        code_graphics_mode2 = chr(27) + r"\[\d\d;\d\d;\d\dm"
-        code_graphics_mode3 = chr(27) + r"\[(3|4)\dm"
-        code_graphics_mode4 = chr(27) + r"\[(9|10)[0-7]m"
-        code_get_cursor_position = chr(27) + r"\[6n"
-        code_cursor_position = chr(27) + r"\[m"
-        code_attrs_off = chr(27) + r"\[0m"
-        code_reverse = chr(27) + r"\[7m"
-        code_cursor_left = chr(27) + r"\[\d+D"
-        code_cursor_forward = chr(27) + r"\[\d*C"
-        code_cursor_up = chr(27) + r"\[\d*A"
-        code_cursor_down = chr(27) + r"\[\d*B"
-        code_wrap_around = chr(27) + r"\[\?7h"
-        code_bracketed_paste_mode = chr(27) + r"\[\?2004h"
-
-        code_set = [
-            code_position_cursor,
-            code_show_cursor,
-            code_erase_line,
-            code_enable_scroll,
-            code_erase_start_line,
-            code_carriage_return,
-            code_disable_line_wrapping,
-            code_erase_line_end,
-            code_reset_mode_screen_options,
-            code_reset_graphics_mode,
-            code_erase_display,
-            code_graphics_mode,
-            code_graphics_mode1,
-            code_graphics_mode2,
-            code_graphics_mode3,
-            code_graphics_mode4,
-            code_get_cursor_position,
-            code_cursor_position,
-            code_erase_display,
-            code_erase_display_0,
-            code_attrs_off,
-            code_reverse,
-            code_cursor_left,
-            code_cursor_up,
-            code_cursor_down,
-            code_cursor_forward,
-            code_wrap_around,
-            code_bracketed_paste_mode,
-        ]
-
-        output = string_buffer
-        for ansi_esc_code in code_set:
-            output = re.sub(ansi_esc_code, "", output)
+
+        output = self.ansi_escape_re.sub("", string_buffer)
 
         # CODE_NEXT_LINE must substitute with return
         output = re.sub(code_next_line, self.RETURN, output)
@@ -57,7 +57,12 @@ class Channel(ABC):
 
 
 class SSHChannel(Channel):
-    def __init__(self, conn: Optional[paramiko.Channel], encoding: str) -> None:
+    def __init__(
+        self,
+        conn: Optional[paramiko.Channel],
+        encoding: str,
+        read_size: int = MAX_BUFFER,
+    ) -> None:
         """
         Placeholder __init__ method so that reading and writing can be moved to the
         channel class.
@@ -65,6 +70,8 @@ class SSHChannel(Channel):
         self.remote_conn = conn
         # FIX: move encoding to GlobalState object?
         self.encoding = encoding
+        # Maximum number of bytes requested from each recv() call
+        self.read_size = read_size
 
     def write_channel(self, out_data: str) -> None:
         if self.remote_conn is None:
@@ -79,7 +86,7 @@ class SSHChannel(Channel):
             raise ReadException("Attempt to read, but there is no active channel.")
         output = ""
         if self.remote_conn.recv_ready():
-            outbuf = self.remote_conn.recv(MAX_BUFFER)
+            outbuf = self.remote_conn.recv(self.read_size)
             if len(outbuf) == 0:
                 raise ReadException("Channel stream closed by remote device.")
             output += outbuf.decode("utf-8", "ignore")
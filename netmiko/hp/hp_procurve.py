@@ -1,14 +1,55 @@
 import re
-import time
+import copy
 import socket
+import time
 from os import path
-from typing import Optional
+from typing import Optional, Dict, Tuple
 
-from paramiko import SSHClient
+from paramiko import SSHClient, HostKeys
 from netmiko.ssh_auth import SSHClient_noauth
 from netmiko.cisco_base_connection import CiscoSSHConnection
+from netmiko.channel import SSHChannel
+from netmiko.exceptions import ReadException, ReadTimeout
+from netmiko.netmiko_globals import LARGE_BUFFER, PROMPT_TAIL_LEN
 from netmiko import log
 
+_PROMPT_PATTERN = r"[>#]"
+_PROMPT_TAIL_PATTERN = r"[>#]\s*$"
+_LOGOUT_PATTERN = (
+    r"(?P<logout>Do you want to log out)|"
+    r"(?P<save>Do you want to save the current)|"
+    r"(?P<closed>Connection closed)"
+)
+# Seconds to wait for each response to logout (poll() and read combined)
+_LOGOUT_TIMEOUT = 1.0
+
+# Parsed known_hosts files keyed on filename, stored with the file's mtime and
+# shared by all connections (single get/set operations, so no lock is needed)
+_HOST_KEYS_CACHE: Dict[str, Tuple[float, HostKeys]] = {}
+
+
+def _get_cached_host_keys(filename: str) -> Optional[HostKeys]:
+    """
+    Return a copy of the host keys in filename (None if the file can't be read).
+
+    The file is only parsed again when its modification time changes.
+    """
+    try:
+        mtime = path.getmtime(filename)
+        cached = _HOST_KEYS_CACHE.get(filename)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, HostKeys(filename))
+            _HOST_KEYS_CACHE[filename] = cached
+    except IOError:
+        return None
+
+    # Copy the entries so keys added to one SSHClient don't leak into another.
+    # HostKeys has no public copy and HostKeys.add() rescans every entry per key,
+    # so the parsed entries are copied directly.
+    host_keys = HostKeys()
+    host_keys._entries = [copy.copy(entry) for entry in cached[1]._entries]
+    return host_keys
+
 
 class HPProcurveBase(CiscoSSHConnection):
     def session_preparation(self) -> None:
@@ -17,6 +58,9 @@ class HPProcurveBase(CiscoSSHConnection):
         """
         # HP output contains VT100 escape codes
         self.ansi_escape_codes = True
+        # Fewer recv() calls on large outputs (i.e. 'show running-config')
+        if isinstance(self.channel, SSHChannel):
+            self.channel.read_size = LARGE_BUFFER
 
         # Procurve over SSH uses 'Press any key to continue'
         data = self._test_channel_read(pattern=r"(any key to continue|[>#])")
@@ -25,9 +69,24 @@ class HPProcurveBase(CiscoSSHConnection):
             self._test_channel_read(pattern=r"[>#]")
 
         self.set_base_prompt()
-        self.set_terminal_width(command="terminal width 511", pattern="terminal")
-        command = self.RETURN + "no page"
-        self.disable_paging(command=command)
+
+        # Send both commands in one write (rather than a round trip per command),
+        # then read past the 'no page' echo and up to the prompt that follows it.
+        # Once the ANSI codes are stripped the echo and prompt can share a line.
+        self.write_channel(
+            self.normalize_cmd("terminal width 511") + self.normalize_cmd("no page")
+        )
+        try:
+            self.read_until_pattern(pattern="no page", read_timeout=5)
+            self.read_until_pattern(
+                pattern=_PROMPT_TAIL_PATTERN, read_timeout=5, tail_len=PROMPT_TAIL_LEN
+            )
+        except ReadTimeout:
+            # Fall back to sending the commands individually
+            self.clear_buffer()
+            self.set_terminal_width(command="terminal width 511", pattern="terminal")
+            command = self.RETURN + "no page"
+            self.disable_paging(command=command)
 
     def enable(
         self,
@@ -43,32 +102,37 @@ class HPProcurveBase(CiscoSSHConnection):
             return ""
 
         output = ""
-        username_pattern = r"(username|login|user name)"
-        pwd_pattern = pattern
-        prompt_pattern = r"[>#]"
-        full_pattern = rf"(username|login|user name|{pwd_pattern}|{prompt_pattern})"
+        pwd_pattern = rf"(?P<pwd>{pattern})|(?P<prompt>{_PROMPT_PATTERN})"
 
         # Send the enable command
         self.write_channel(cmd + self.RETURN)
-        new_output = self.read_until_pattern(
-            full_pattern, read_timeout=15, re_flags=re_flags
+        new_output, enable_match = self._read_until_match(
+            rf"(?P<user>user\ name|username|login)|{pwd_pattern}",
+            read_timeout=15,
+            re_flags=re_flags,
+            tail_len=PROMPT_TAIL_LEN,
         )
 
         # Send the username
-        if re.search(username_pattern, new_output, flags=re_flags):
+        if enable_match.lastgroup == "user":
             output += new_output
             self.write_channel(default_username + self.RETURN)
-            full_pattern = rf"{pwd_pattern}|{prompt_pattern})"
-            new_output = self.read_until_pattern(
-                full_pattern, read_timeout=15, re_flags=re_flags
+            new_output, enable_match = self._read_until_match(
+                pwd_pattern,
+                read_timeout=15,
+                re_flags=re_flags,
+                tail_len=PROMPT_TAIL_LEN,
             )
 
         # Send the password
-        if re.search(pwd_pattern, new_output, flags=re_flags):
+        if enable_match.lastgroup == "pwd":
             output += new_output
             self.write_channel(self.secret + self.RETURN)
             new_output = self.read_until_pattern(
-                prompt_pattern, read_timeout=15, re_flags=re_flags
+                _PROMPT_PATTERN,
+                read_timeout=15,
+                re_flags=re_flags,
+                tail_len=PROMPT_TAIL_LEN,
             )
 
         output += new_output
@@ -78,7 +142,8 @@ class HPProcurveBase(CiscoSSHConnection):
             "Failed to enter enable mode. Please ensure you pass "
             "the 'secret' argument to ConnectHandler."
         )
-        if not self.check_enable_mode():
+        # A trailing '#' prompt already confirms enable mode
+        if not new_output.rstrip().endswith("#") and not self.check_enable_mode():
             raise ValueError(msg)
         return output
 
@@ -98,25 +163,38 @@ class HPProcurveBase(CiscoSSHConnection):
         count = 0
         output = ""
         while count <= 10:
-            time.sleep(0.3)
-
             # The connection might be dead here.
             try:
-                new_output = self.read_channel()
+                # Block in poll() until the device responds (no sleep/read cycles).
+                # The wait and the read share one time budget per iteration.
+                start = time.time()
+                if not self._wait_readable(timeout=_LOGOUT_TIMEOUT):
+                    break
+                remaining = _LOGOUT_TIMEOUT - (time.time() - start)
+                new_output, logout_match = self._read_until_match(
+                    pattern=_LOGOUT_PATTERN, read_timeout=max(remaining, 0.01)
+                )
                 output += new_output
-            except socket.error:
+            except ReadTimeout:
+                # No logout prompt from the device; pick up anything left and stop
+                try:
+                    output += self._drain_channel()
+                except (socket.error, ReadException):
+                    pass
+                break
+            except (socket.error, ReadException):
                 break
 
-            if "Do you want to log out" in new_output:
-                self.write_channel("y" + self.RETURN)
-            elif "Do you want to save the current" in new_output:
-                # Don't automatically save the config (user's responsibility)
-                self.write_channel("n" + self.RETURN)
-            else:
-                try:
-                    self.write_channel(self.RETURN)
-                except socket.error:
+            try:
+                if logout_match.lastgroup == "logout":
+                    self.write_channel("y" + self.RETURN)
+                elif logout_match.lastgroup == "save":
+                    # Don't automatically save the config (user's responsibility)
+                    self.write_channel("n" + self.RETURN)
+                else:
                     break
+            except socket.error:
+                break
             count += 1
 
         # Set outside of loop
@@ -145,11 +223,24 @@ class HPProcurveSSH(HPProcurveBase):
         else:
             remote_conn_pre = SSHClient()
 
-        # Load host_keys for better SSH security
+        # Load host_keys for better SSH security (same files as load_system_host_keys()
+        # and load_host_keys(), but without re-parsing unchanged files every time)
         if self.system_host_keys:
-            remote_conn_pre.load_system_host_keys()
+            system_host_keys = _get_cached_host_keys(
+                path.expanduser("~/.ssh/known_hosts")
+            )
+            if system_host_keys is None:
+                # Windows fallback also used by older paramiko versions
+                system_host_keys = _get_cached_host_keys(
+                    path.expanduser("~/ssh/known_hosts")
+                )
+            if system_host_keys is not None:
+                remote_conn_pre._system_host_keys = system_host_keys
         if self.alt_host_keys and path.isfile(self.alt_key_file):
-            remote_conn_pre.load_host_keys(self.alt_key_file)
+            alt_host_keys = _get_cached_host_keys(self.alt_key_file)
+            if alt_host_keys is not None:
+                remote_conn_pre._host_keys = alt_host_keys
+                remote_conn_pre._host_keys_filename = self.alt_key_file
 
         # Default is to automatically add untrusted hosts (make sure appropriate for your env)
         remote_conn_pre.set_missing_host_key_policy(self.key_policy)
@@ -4,37 +4,43 @@ import re
 import warnings
 
 from netmiko.no_enable import NoEnable
-from netmiko.base_connection import DELAY_FACTOR_DEPR_SIMPLE_MSG
+from netmiko.base_connection import ANSI_ESCAPE_RE, DELAY_FACTOR_DEPR_SIMPLE_MSG
+from netmiko.channel import SSHChannel
 from netmiko.cisco_base_connection import CiscoBaseConnection
-from netmiko.exceptions import NetmikoAuthenticationException
+from netmiko.exceptions import NetmikoAuthenticationException, ReadTimeout
+from netmiko.netmiko_globals import LARGE_BUFFER, PROMPT_TAIL_LEN
+from netmiko.utilities import compile_regex
 from netmiko import log
 
+# Huawei cursor left (ESC[1D) preceded by an extra space
+_HUAWEI_CURSOR_LEFT_PATTERN = r" \x1b\[\d+D"
+# Leading HRP_. characters for USGv5 HA (applied to the single prompt line)
+_HRP_RE = compile_regex(r"^HRP_.")
+_PWD_CHANGE_PATTERN = r"(?P<pwc>Change now|Please choose)|(?P<prompt>[\]>]\s*$)"
+# Bounded (instead of .+) to limit backtracking on long login banners
+_TELNET_PWD_CHANGE_PATTERN = r"(?:Change now|Please choose 'YES' or 'NO').{0,80}"
+
 
 class HuaweiBase(NoEnable, CiscoBaseConnection):
+    # Huawei does a strange thing where they add a space and then add ESC[1D to
+    # move the cursor to the left one. The extra space is problematic, so strip
+    # it in the same pass as the other ANSI escape codes.
+    ansi_escape_re = compile_regex(
+        _HUAWEI_CURSOR_LEFT_PATTERN + "|" + ANSI_ESCAPE_RE.pattern
+    )
+
     def session_preparation(self) -> None:
         """Prepare the session after the connection has been established."""
         self.ansi_escape_codes = True
+        # Fewer recv() calls on large outputs (i.e. 'display current-configuration')
+        if isinstance(self.channel, SSHChannel):
+            self.channel.read_size = LARGE_BUFFER
         self._test_channel_read()
         self.set_base_prompt()
         self.disable_paging(command="screen-length 0 temporary")
-        # Clear the read buffer
-        time.sleep(0.3 * self.global_delay_factor)
+        # Clear the read buffer (disable_paging already read up to the prompt)
         self.clear_buffer()
 
-    def strip_ansi_escape_codes(self, string_buffer: str) -> str:
-        """
-        Huawei does a strange thing where they add a space and then add ESC[1D
-        to move the cursor to the left one.
-
-        The extra space is problematic.
-        """
-        code_cursor_left = chr(27) + r"\[\d+D"
-        output = string_buffer
-        pattern = rf" {code_cursor_left}"
-        output = re.sub(pattern, "", output)
-
-        return super().strip_ansi_escape_codes(output)
-
     def config_mode(
         self,
         config_command: str = "system-view",
@@ -68,25 +74,36 @@ class HuaweiBase(NoEnable, CiscoBaseConnection):
         For Huawei this will be the router prompt with < > or [ ] stripped off.
 
         This will be set on logging in, but not when entering system-view
+
+        delay_factor: Deprecated in Netmiko 4.x. Will be eliminated in Netmiko 5.
         """
         # log.debug("In set_base_prompt")
-        delay_factor = self.select_delay_factor(delay_factor)
         self.clear_buffer()
         self.write_channel(self.RETURN)
-        time.sleep(0.5 * delay_factor)
-
-        prompt = self.read_channel()
+        pri_terminator = re.escape(pri_prompt_terminator)
+        alt_terminator = re.escape(alt_prompt_terminator)
+        try:
+            prompt, _ = self._read_until_match(
+                pattern=rf"(?:{pri_terminator}|{alt_terminator})\s*$",
+                read_timeout=5.0,
+                tail_len=PROMPT_TAIL_LEN,
+                keep_on_timeout=True,
+            )
+        except ReadTimeout:
+            # Let the terminator check below report what was received
+            prompt = self.read_channel()
 
         # If multiple lines in the output take the last line
         prompt = prompt.split(self.RESPONSE_RETURN)[-1]
         prompt = prompt.strip()
 
         # Check that ends with a valid terminator character
-        if not prompt[-1] in (pri_prompt_terminator, alt_prompt_terminator):
+        terminators = (pri_prompt_terminator, alt_prompt_terminator)
+        if not prompt or prompt[-1] not in terminators:
             raise ValueError(f"Router prompt not found: {prompt}")
 
         # Strip off any leading HRP_. characters for USGv5 HA
-        prompt = re.sub(r"^HRP_.", "", prompt, flags=re.M)
+        prompt = _HRP_RE.sub("", prompt)
 
         # Strip off leading and trailing terminator
         prompt = prompt[1:-1]
@@ -112,9 +129,11 @@ class HuaweiSSH(HuaweiBase):
         """Handle password change request by ignoring it"""
 
         # Huawei can prompt for password change. Search for that or for normal prompt
-        password_change_prompt = r"((Change now|Please choose))|([\]>]\s*$)"
-        output = self.read_until_pattern(password_change_prompt)
-        if re.search(password_change_prompt, output):
+        # (the prompt has usually already arrived, so this returns on the first read)
+        _, pwd_change_match = self._read_until_match(
+            _PWD_CHANGE_PATTERN, tail_len=PROMPT_TAIL_LEN
+        )
+        if pwd_change_match.lastgroup == "pwc":
             self.write_channel("N\n")
             self.clear_buffer()
         return None
@@ -135,43 +154,59 @@ class HuaweiTelnet(HuaweiBase):
         """Telnet login for Huawei Devices"""
 
         delay_factor = self.select_delay_factor(delay_factor)
-        password_change_prompt = r"(Change now|Please choose 'YES' or 'NO').+"
-        combined_pattern = r"({}|{}|{})".format(
+        password_change_prompt = _TELNET_PWD_CHANGE_PATTERN
+        # The terminators are anchored at the end of the output, so no re.M is needed
+        prompt_pattern = rf"(?:{pri_prompt_terminator}|{alt_prompt_terminator})"
+        prompt_re = re.compile(prompt_pattern)
+        # Named groups tell which alternative matched
+        combined_pattern = r"(?P<pri>{})|(?P<alt>{})|(?P<pwc>{})".format(
             pri_prompt_terminator, alt_prompt_terminator, password_change_prompt
         )
+        # Only a prompt on the last line counts, so a banner such as
+        # "Login authentication" before "Password:" isn't taken as a username prompt
+        initial_pattern = (
+            rf"(?P<user>{username_pattern})[^\n]*\Z|(?P<pwd>{pwd_pattern})[^\n]*\Z"
+        )
 
         output = ""
         return_msg = ""
         i = 1
         while i <= max_loops:
             try:
-                # Search for username pattern / send username
-                output = self.read_until_pattern(
-                    pattern=username_pattern, re_flags=re.I
+                # Search for username or password pattern (password-only login)
+                output, initial_match = self._read_until_match(
+                    pattern=initial_pattern, re_flags=re.I, tail_len=PROMPT_TAIL_LEN
                 )
                 return_msg += output
-                self.write_channel(self.username + self.TELNET_RETURN)
 
-                # Search for password pattern / send password
-                output = self.read_until_pattern(pattern=pwd_pattern, re_flags=re.I)
-                return_msg += output
+                # Send username / search for password pattern
+                if initial_match.lastgroup == "user":
+                    self.write_channel(self.username + self.TELNET_RETURN)
+                    output = self.read_until_pattern(
+                        pattern=pwd_pattern, re_flags=re.I, tail_len=PROMPT_TAIL_LEN
+                    )
+                    return_msg += output
+
+                # Send password
                 assert self.password is not None
                 self.write_channel(self.password + self.TELNET_RETURN)
 
                 # Waiting for combined output
-                output = self.read_until_pattern(pattern=combined_pattern)
+                output, login_match = self._read_until_match(
+                    pattern=combined_pattern, tail_len=PROMPT_TAIL_LEN
+                )
                 return_msg += output
 
                 # Search for password change prompt, send "N"
-                if re.search(password_change_prompt, output):
+                if login_match.lastgroup == "pwc":
                     self.write_channel("N" + self.TELNET_RETURN)
-                    output = self.read_until_pattern(pattern=combined_pattern)
+                    output, login_match = self._read_until_match(
+                        pattern=combined_pattern, tail_len=PROMPT_TAIL_LEN
+                    )
                     return_msg += output
 
                 # Check if proper data received
-                if re.search(pri_prompt_terminator, output, flags=re.M) or re.search(
-                    alt_prompt_terminator, output, flags=re.M
-                ):
+                if login_match.lastgroup in ("pri", "alt"):
                     return return_msg
 
                 self.write_channel(self.TELNET_RETURN)
@@ -186,12 +221,17 @@ class HuaweiTelnet(HuaweiBase):
 
         # Last try to see if we already logged in
         self.write_channel(self.TELNET_RETURN)
-        time.sleep(0.5 * delay_factor)
-        output = self.read_channel()
+        try:
+            output, _ = self._read_until_match(
+                pattern=prompt_pattern,
+                read_timeout=5.0,
+                tail_len=PROMPT_TAIL_LEN,
+                keep_on_timeout=True,
+            )
+        except ReadTimeout:
+            output = self.read_channel()
         return_msg += output
-        if re.search(pri_prompt_terminator, output, flags=re.M) or re.search(
-            alt_prompt_terminator, output, flags=re.M
-        ):
+        if prompt_re.search(output, max(0, len(output) - PROMPT_TAIL_LEN)):
             return return_msg
 
         assert self.remote_conn is not None
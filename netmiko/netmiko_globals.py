@@ -1,2 +1,6 @@
 MAX_BUFFER = 65535
+# recv() size for platforms that routinely return very large outputs
+LARGE_BUFFER = 262144
 BACKSPACE_CHAR = "\x08"
+# Longest expected prompt match; see read_until_pattern(tail_len=...)
+PROMPT_TAIL_LEN = 512
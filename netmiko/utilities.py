@@ -16,6 +16,7 @@ from glob import glob
 import sys
 import io
 import os
+import re
 from pathlib import Path
 import functools
 from datetime import datetime
@@ -61,6 +62,22 @@ try:
 except ImportError:
     PYSERIAL_INSTALLED = False
 
+try:
+    import re2
+
+    RE2_INSTALLED = True
+except ImportError:
+    RE2_INSTALLED = False
+
+# google-re2 is only used when explicitly enabled: NETMIKO_USE_RE2=1
+RE2_ENABLED = RE2_INSTALLED and os.environ.get("NETMIKO_USE_RE2", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Flags that can be expressed as re2 inline flags
+RE2_INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
 # Dictionary mapping 'show run' for vendors with different command
 SHOW_RUN_MAPPER = {
     "brocade_fos": "configShow",
@@ -590,6 +607,27 @@ The argument 'ttp_template=/path/to/template.ttp' must be set when use_ttp=True
     return raw_data
 
 
+@functools.lru_cache(maxsize=128)
+def compile_regex(pattern: str, flags: int = 0) -> Any:
+    """
+    Compile (and cache) a regular expression.
+
+    When google-re2 is installed and enabled (NETMIKO_USE_RE2=1) the pattern is compiled
+    with re2, which matches in linear time without backtracking. Patterns or flags that
+    re2 does not support fall back to the standard library re module.
+    """
+    if RE2_ENABLED and not flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL):
+        inline_flags = "".join(
+            letter for flag, letter in RE2_INLINE_FLAGS.items() if flags & flag
+        )
+        re2_pattern = f"(?{inline_flags}){pattern}" if inline_flags else pattern
+        try:
+            return re2.compile(re2_pattern)
+        except re2.error:
+            log.debug(f"re2 unable to compile pattern, using re: {pattern}")
+    return re.compile(pattern, flags=flags)
+
+
 def select_cmd_verify(func: F) -> F:
     """Override function cmd_verify argument with global setting."""
 
@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 
+import re
 import time
 from os.path import dirname, join
 from threading import Lock
 
 from netmiko import NetmikoTimeoutException
+from netmiko.exceptions import ReadTimeout
 from netmiko.base_connection import BaseConnection
 
 RESOURCE_FOLDER = join(dirname(dirname(__file__)), "etc")
@@ -409,6 +411,109 @@ def test_lock_timeout_loop():
     lock_unlock_timeout(0.2)
 
 
+def test_cached_mode_check():
+    """Mode check is only repeated after something is written to the channel"""
+    connection = FakeBaseConnection(_write_counter=0, _priv_mode_cache={})
+    calls = []
+
+    def mode_check():
+        calls.append(1)
+        return True
+
+    assert connection._cached_mode_check(("enable", "#"), mode_check)
+    assert connection._cached_mode_check(("enable", "#"), mode_check)
+    assert len(calls) == 1
+
+    connection._write_counter += 1
+    assert connection._cached_mode_check(("enable", "#"), mode_check)
+    assert len(calls) == 2
+
+
+class FakeChannel:
+    def __init__(self):
+        self.writes = []
+
+    def write_channel(self, out_data):
+        self.writes.append(out_data)
+
+
+def test_check_config_mode_cached():
+    """A config mode check right after another one doesn't touch the device"""
+    connection = FakeBaseConnection(
+        _write_counter=0,
+        _priv_mode_cache={},
+        RETURN="\n",
+        encoding="utf-8",
+        session_log=None,
+        channel=FakeChannel(),
+    )
+    connection.read_channel_timing = lambda *args, **kwargs: "router(config)#"
+    assert connection.check_config_mode(check_string=")#")
+    assert connection.check_config_mode(check_string=")#")
+    assert connection.channel.writes == ["\n"]
+
+    connection.write_channel("end\n")
+    connection.read_channel_timing = lambda *args, **kwargs: "router#"
+    assert not connection.check_config_mode(check_string=")#")
+    assert connection.channel.writes == ["\n", "end\n", "\n"]
+
+
+def test_read_until_pattern_tail_len():
+    """Pattern split across reads is found when only the tail is re-searched"""
+    chunks = ["x" * 2000 + "\nrouter", "1#", "more"]
+    connection = FakeBaseConnection(read_timeout_override=None, _read_buffer="")
+    connection.read_channel = lambda: chunks.pop(0) if chunks else ""
+    output = connection.read_until_pattern(pattern=r"router1#", tail_len=64)
+    assert output.endswith("\nrouter1#")
+    assert chunks == ["more"]
+
+
+def test_read_until_match_named_groups():
+    """Named group patterns are supported and the remainder is kept in _read_buffer"""
+    chunks = ["Login authentication\nPassword: ", "extra"]
+    connection = FakeBaseConnection(read_timeout_override=None, _read_buffer="")
+    connection.read_channel = lambda: chunks.pop(0) if chunks else ""
+    output, match = connection._read_until_match(
+        pattern=r"(?P<user>username)|(?P<pwd>(pass)word)", re_flags=re.I
+    )
+    assert output == "Login authentication\nPassword"
+    assert match.lastgroup == "pwd"
+    assert connection._read_buffer == ": "
+
+
+def test_read_until_match_keep_on_timeout():
+    """Output read before a ReadTimeout is put back into _read_buffer"""
+    chunks = ["some garbage"]
+    connection = FakeBaseConnection(read_timeout_override=None, _read_buffer="")
+    connection.read_channel = lambda: chunks.pop(0) if chunks else ""
+    try:
+        connection._read_until_match(
+            pattern=r"router1#", read_timeout=0.05, keep_on_timeout=True
+        )
+    except ReadTimeout:
+        assert connection._read_buffer == "some garbage"
+        return
+
+    assert False
+
+
+def test_wait_readable_not_ssh():
+    """Non-SSH connections (and buffered data) never block in poll()"""
+    connection = FakeBaseConnection(_read_buffer="", remote_conn=object())
+    assert connection._wait_readable(timeout=0)
+    connection = FakeBaseConnection(_read_buffer="router1#", remote_conn=None)
+    assert connection._wait_readable(timeout=0)
+
+
+def test_drain_channel():
+    """Read until a read returns no new data"""
+    chunks = ["router1#", "show ver", "", "later"]
+    connection = FakeBaseConnection()
+    connection.read_channel = lambda: chunks.pop(0) if chunks else ""
+    assert connection._drain_channel() == "router1#show ver"
+    assert chunks == ["later"]
+
+
 def test_strip_ansi_codes():
     connection = FakeBaseConnection(RETURN="\n")
     ansi_codes_to_strip = [
@@ -474,3 +579,6 @@ def test_strip_ansi_codes():
 
     # code_next_line must be substituted with a return
     assert connection.strip_ansi_escape_codes("\x1bE") == "\n"
+
+    # Output without any ESC characters is returned unchanged
+    assert connection.strip_ansi_escape_codes("show version\n") == "show version\n"
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+import os
+import time
+
+from paramiko import AutoAddPolicy, RSAKey
+
+from netmiko.hp import hp_procurve
+from netmiko.hp.hp_procurve import HPProcurveSSH, _get_cached_host_keys
+
+
+class FakeHPProcurve(HPProcurveSSH):
+    def __init__(self, replies, **kwargs):
+        self.replies = list(replies)
+        self.writes = []
+        self._read_buffer = ""
+        self.read_timeout_override = None
+        self.RETURN = "\n"
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def write_channel(self, out_data):
+        self.writes.append(out_data)
+
+    def read_channel(self):
+        output = self._read_buffer + (self.replies.pop(0) if self.replies else "")
+        self._read_buffer = ""
+        return output
+
+    def check_enable_mode(self, check_string="#"):
+        return False
+
+    def check_config_mode(self, check_string=")#", pattern=""):
+        return False
+
+    def clear_buffer(self, *args, **kwargs):
+        return ""
+
+
+def test_enable_username_and_password():
+    """Send the default username and then the secret"""
+    connection = FakeHPProcurve(
+        ["enable\nUsername: ", "manager\nPassword: ", "\nswitch# "], secret="secret"
+    )
+    output = connection.enable()
+    assert connection.writes == ["enable\n", "manager\n", "secret\n"]
+    assert output.endswith("switch#")
+
+
+def test_enable_password_only():
+    """Send only the secret when no username is requested"""
+    connection = FakeHPProcurve(["enable\nPassword: ", "\nswitch# "], secret="secret")
+    connection.enable()
+    assert connection.writes == ["enable\n", "secret\n"]
+
+
+def test_session_preparation_no_page_same_line():
+    """The prompt after 'no page' is found when it shares a line with the echo"""
+    connection = FakeHPProcurve(
+        ["terminal width 511switch# no pageswitch# "], channel=None
+    )
+    connection._test_channel_read = lambda *args, **kwargs: "switch# "
+    connection.set_base_prompt = lambda *args, **kwargs: "switch"
+    connection.session_preparation()
+    assert connection.writes == ["terminal width 511\nno page\n"]
+    assert connection._read_buffer == ""
+
+
+def test_get_cached_host_keys(tmp_path):
+    """known_hosts is parsed once per mtime and each caller gets its own copy"""
+    key = RSAKey.generate(1024)
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(f"host1 {key.get_name()} {key.get_base64()}\n")
+    filename = str(known_hosts)
+
+    host_keys = _get_cached_host_keys(filename)
+    cached = hp_procurve._HOST_KEYS_CACHE[filename]
+    assert "host1" in host_keys
+
+    # Cache hit, and keys added to one copy don't leak into the next
+    host_keys.add("host2", key.get_name(), key)
+    other_host_keys = _get_cached_host_keys(filename)
+    assert hp_procurve._HOST_KEYS_CACHE[filename] is cached
+    assert "host1" in other_host_keys
+    assert "host2" not in other_host_keys
+
+    # A new mtime causes the file to be parsed again
+    with open(filename, "a") as f:
+        f.write(f"host3 {key.get_name()} {key.get_base64()}\n")
+    mtime = os.path.getmtime(filename) + 10
+    os.utime(filename, (mtime, mtime))
+    assert "host3" in _get_cached_host_keys(filename)
+    assert hp_procurve._HOST_KEYS_CACHE[filename] is not cached
+
+    assert _get_cached_host_keys(str(tmp_path / "missing")) is None
+
+
+def test_cleanup_timeout_budget():
+    """Waiting for data and reading share one time budget per iteration"""
+    connection = FakeHPProcurve([])
+
+    def wait_readable(timeout):
+        time.sleep(0.5)
+        return True
+
+    connection._wait_readable = wait_readable
+    start = time.time()
+    connection.cleanup()
+    assert time.time() - start < 1.4
+    assert connection.writes == ["logout\n"]
+
+
+def test_cleanup_logout_prompts():
+    """Decline saving, confirm logout and stop once the connection is closed"""
+    connection = FakeHPProcurve(
+        [
+            "logout\nDo you want to save the current configuration [y/n]? ",
+            "n\nDo you want to log out [y/n]? ",
+            "y\nConnection closed",
+        ],
+        remote_conn=None,
+    )
+    connection.cleanup()
+    assert connection.writes == ["logout\n", "n\n", "y\n"]
+    assert connection._session_log_fin
+
+
+def test_cleanup_no_logout_prompt():
+    """Stop when the device doesn't ask anything after logout"""
+    connection = FakeHPProcurve(
+        ["logout\n", "switch# "], remote_conn=None, read_timeout_override=0.1
+    )
+    connection.cleanup()
+    assert connection.writes == ["logout\n"]
+    assert connection.replies == []
+
+
+def test_cleanup_max_iterations():
+    """Repeated logout prompts are answered at most 11 times"""
+    connection = FakeHPProcurve(
+        ["Do you want to log out [y/n]? "] * 20, remote_conn=None
+    )
+    connection.cleanup()
+    assert connection.writes == ["logout\n"] + ["y\n"] * 11
+
+
+def test_build_ssh_client_windows_known_hosts(tmp_path, monkeypatch):
+    """Fall back to ~/ssh/known_hosts when ~/.ssh/known_hosts can't be read"""
+    key = RSAKey.generate(1024)
+    (tmp_path / "ssh").mkdir()
+    known_hosts = tmp_path / "ssh" / "known_hosts"
+    known_hosts.write_text(f"host1 {key.get_name()} {key.get_base64()}\n")
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    connection = FakeHPProcurve(
+        [],
+        use_keys=True,
+        password="secret",
+        system_host_keys=True,
+        alt_host_keys=False,
+        key_policy=AutoAddPolicy(),
+    )
+    remote_conn_pre = connection._build_ssh_client()
+    assert "host1" in remote_conn_pre._system_host_keys
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import pytest
+
+from netmiko.huawei.huawei import HuaweiSSH, HuaweiTelnet
+
+
+class FakeHuaweiTelnet(HuaweiTelnet):
+    def __init__(self, replies, **kwargs):
+        self.replies = list(replies)
+        self.writes = []
+        self._read_buffer = ""
+        self.read_timeout_override = None
+        self.global_delay_factor = 1.0
+        self.fast_cli = False
+        self.TELNET_RETURN = "\r\n"
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def write_channel(self, out_data):
+        self.writes.append(out_data)
+
+    def read_channel(self):
+        output = self._read_buffer + (self.replies.pop(0) if self.replies else "")
+        self._read_buffer = ""
+        return output
+
+
+def test_telnet_login_password_only():
+    """A 'Login authentication' banner is not mistaken for a username prompt"""
+    connection = FakeHuaweiTelnet(
+        ["Login authentication\r\n\r\nPassword:", "\r\n<huawei>"],
+        username="admin",
+        password="secret",
+    )
+    output = connection.telnet_login()
+    assert connection.writes == ["secret\r\n"]
+    assert output.endswith("<huawei>")
+
+
+def test_telnet_login_username_and_password():
+    """Send the username and then the password"""
+    connection = FakeHuaweiTelnet(
+        ["Login authentication\r\n\r\nUsername:", "admin\r\nPassword:", "\r\n<huawei>"],
+        username="admin",
+        password="secret",
+    )
+    connection.telnet_login()
+    assert connection.writes == ["admin\r\n", "secret\r\n"]
+
+
+def test_set_base_prompt_terminators():
+    """The prompt is read up to the terminators that were passed in"""
+    connection = FakeHuaweiTelnet(
+        ["\n(huawei)"], RETURN="\n", RESPONSE_RETURN="\n", clear_buffer=lambda: ""
+    )
+    prompt = connection.set_base_prompt(
+        pri_prompt_terminator=")", alt_prompt_terminator="#"
+    )
+    assert prompt == "huawei"
+
+
+def test_set_base_prompt_not_found():
+    """Output without a terminator is reported in the ValueError"""
+    connection = FakeHuaweiTelnet(
+        ["\nsome garbage no terminator"],
+        RETURN="\n",
+        RESPONSE_RETURN="\n",
+        clear_buffer=lambda: "",
+        read_timeout_override=0.1,
+    )
+    with pytest.raises(ValueError, match="some garbage no terminator"):
+        connection.set_base_prompt()
+
+
+def test_set_base_prompt_no_output():
+    """No output at all raises ValueError rather than IndexError"""
+    connection = FakeHuaweiTelnet(
+        [],
+        RETURN="\n",
+        RESPONSE_RETURN="\n",
+        clear_buffer=lambda: "",
+        read_timeout_override=0.1,
+    )
+    with pytest.raises(ValueError):
+        connection.set_base_prompt()
+
+
+def test_special_login_handler_pwd_change():
+    """Decline the password change prompt"""
+    connection = FakeHuaweiTelnet(
+        ["Info: The password needs to be changed. Change now? [Y/N]:"],
+        clear_buffer=lambda: "",
+    )
+    HuaweiSSH.special_login_handler(connection)
+    assert connection.writes == ["N\n"]
+
+
+def test_special_login_handler_prompt():
+    """Nothing is sent when the prompt arrives directly"""
+    connection = FakeHuaweiTelnet(["Info: Last login\n<huawei>"])
+    HuaweiSSH.special_login_handler(connection)
+    assert connection.writes == []
+    assert connection._read_buffer == ""
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import os
+import re
 import sys
 from os.path import dirname, join, relpath
 import pytest
@@ -393,3 +394,11 @@ def test_delay_factor_compat(max_loops, delay_factor, timeout, result):
     )
     print(read_timeout)
     assert read_timeout == result
+
+
+def test_compile_regex():
+    """Compiled patterns honor flags and are cached"""
+    prompt_re = utilities.compile_regex(r"[>#]\s*$", re.M)
+    assert prompt_re.search("switch#\nmore output")
+    assert utilities.compile_regex(r"[>#]\s*$", re.M) is prompt_re
+    assert utilities.compile_regex("password", re.I).search("Password:")